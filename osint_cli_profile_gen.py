@@ -9,12 +9,122 @@ import random
 import hashlib
 import os
 import sys
-import webbrowser
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import uuid
+from itertools import chain, product
+from operator import itemgetter
+from typing import Callable, Dict, List, Any, Iterable, Iterator, Optional
+
+# Characters dropped when turning a company name into a domain slug
+_SLUG_TABLE = str.maketrans('', '', ' ,.')
+
+# Fixed company attributes, shared instead of rebuilt per company
+_COMPANY_SIZES = ('10-50', '51-200', '201-1000', '1000+')
+_DEPARTMENTS = ('Engineering', 'Sales', 'Marketing', 'HR', 'Finance')
+
+# Buffer size for export files: fewer flushes through the text/buffered IO stack
+_EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Entries joined per write when saving a wordlist
+_WORDLIST_WRITE_CHUNK = 8192
+
+# Entries kept in memory after writing a wordlist, for previews
+_WORDLIST_PREVIEW_SIZE = 10
+
+# Fixed wordlist suffixes, shared instead of rebuilt per profile
+_WORDLIST_NUMBERS = ('123', '1234', '12345')
+_WORDLIST_SUFFIXES = ('!', '@', '#', '01', '02', '03', '99', '00')
+_WORDLIST_YEAR_SUFFIXES = ('!', '@', '#')
+
+# HTML card templates for the visualizer, filled with str.format once per card
+_PROFILE_CARD_TEMPLATE = (
+    '<div class="profile-card" data-person-id="{p[id]}">'
+    '<div class="profile-header">'
+    '<img src="{p[profile_pic]}" alt="{p[full_name]}" class="profile-pic">'
+    '<div>'
+    '<div class="profile-name">{p[full_name]}</div>'
+    '<div class="profile-title">{p[job_title]}</div>'
+    '<div class="profile-meta">{p[company]} • {p[city]}</div>'
+    '</div></div>'
+    '<div class="profile-details">'
+    '<div class="detail-item"><div class="detail-label">Email:</div>{p[email]}</div>'
+    '<div class="detail-item"><div class="detail-label">Age:</div>{p[age]} years old</div>'
+    '<div class="detail-item"><div class="detail-label">University:</div>{p[university]}</div>'
+    '<div class="detail-item"><div class="detail-label">LinkedIn:</div>{p[linkedin_connections]} connections</div>'
+    '<div class="detail-item"><div class="detail-label">Posts:</div>{posts}</div>'
+    '<div class="detail-item"><div class="detail-label">Followers:</div>{followers}</div>'
+    '</div></div>'
+)
+
+_COMPANY_CARD_TEMPLATE = (
+    '<div class="profile-card company-card" data-company-id="{c[id]}">'
+    '<div class="profile-header">'
+    '<div style="width: 60px; height: 60px; background: rgba(255,255,255,0.2); border-radius: 10px; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold; font-size: 18px;">'
+    '{initial}</div>'
+    '<div>'
+    '<div class="profile-name">{c[name]}</div>'
+    '<div class="profile-title">{c[industry]}</div>'
+    '<div class="profile-meta">{c[location]} • {employee_count} employees</div>'
+    '</div></div>'
+    '<div class="profile-details">'
+    '<div class="detail-item"><div class="detail-label">Size:</div>{c[size]}</div>'
+    '<div class="detail-item"><div class="detail-label">Website:</div>{c[website]}</div>'
+    '<div class="detail-item"><div class="detail-label">Departments:</div>{department_count}</div>'
+    '<div class="detail-item" style="grid-column: span 2;"><div class="detail-label">Recent Employees:</div>'
+    '{recent}{more}'
+    '</div></div></div>'
+)
+
+_SOCIAL_CARD_TEMPLATE = (
+    '<div class="profile-card" data-person-id="{p[id]}">'
+    '<div class="profile-header">'
+    '<img src="{p[profile_pic]}" alt="{p[full_name]}" class="profile-pic">'
+    '<div>'
+    '<div class="profile-name">@{handle}</div>'
+    '<div class="profile-title">{p[full_name]}</div>'
+    '<div class="profile-meta">{s[followers]} followers • {s[posts]} posts</div>'
+    '</div></div>'
+    '<div class="profile-details">'
+    '<div class="detail-item"><div class="detail-label">Posts:</div>{s[posts]}</div>'
+    '<div class="detail-item"><div class="detail-label">Followers:</div>{s[followers]}</div>'
+    '<div class="detail-item"><div class="detail-label">Following:</div>{s[following]}</div>'
+    '<div class="detail-item"><div class="detail-label">Last Active:</div>{last_active}</div>'
+    '<div class="detail-item" style="grid-column: span 2;"><div class="detail-label">Social Links:</div>LinkedIn, Twitter{github}'
+    '</div></div></div>'
+)
+
+# Static menu screens, rendered once and written in a single call
+_BANNER = "\n".join((
+    "="*60,
+    "🔍 OSINT PROFILE GENERATOR CLI",
+    "Educational Synthetic Data Generator for OSINT Training",
+    "="*60,
+    "",
+    "",
+))
+
+_MAIN_MENU = "\n".join((
+    "📋 MAIN MENU",
+    "-"*30,
+    "1. Generate Profiles",
+    "2. Export Data",
+    "3. Generate HTML Visualizer",
+    "4. Generate Wordlist",
+    "5. View Statistics",
+    "6. Clear All Data",
+    "7. Exit",
+    "",
+    "",
+))
 
 class OSINTProfileGenerator:
+    CSV_HEADERS = (
+        'ID', 'FullName', 'FirstName', 'LastName', 'Email', 'Phone', 'Age', 'Birthdate',
+        'Company', 'JobTitle', 'City', 'University', 'GraduationYear', 'LinkedInConnections',
+        'LinkedIn', 'Twitter', 'GitHub', 'PasswordHint', 'PasswordHash', 'ProfileURL',
+        'Posts', 'Followers', 'Following', 'LastActive', 'GeneratedAt'
+    )
+
     def __init__(self):
         # Sample data arrays for realistic generation
         self.sample_data = {
@@ -71,12 +181,35 @@ class OSINTProfileGenerator:
             ]
         }
         
+        # Read-only after construction: tuples index faster than lists, and
+        # interned strings hash/compare by identity when used as dict keys
+        for key, values in self.sample_data.items():
+            self.sample_data[key] = tuple(sys.intern(value) for value in values)
+        
         self.database = {
             'profiles': [],
             'companies': [],
             'social_profiles': [],
             'relationships': []
         }
+        
+        # Company name -> domain, computed once instead of per email/website
+        self._company_domains = {
+            company: company.lower().translate(_SLUG_TABLE) + '.com'
+            for company in self.sample_data['companies']
+        }
+        
+        # Company name -> first word, used as a password component
+        self._company_words = {company: company.split(' ')[0] for company in self.sample_data['companies']}
+        
+        # person_id -> social profile index, kept in step by generate_dataset
+        self._social_by_pid = {}
+        
+        # Running profile count, age sum and company Counter, folded in as profiles are
+        # generated and rebuilt by profile_stats if the profile list changes underneath
+        self._age_n = 0
+        self._age_sum = 0
+        self._company_counter = Counter()
 
     def get_random_element(self, arr: List[str]) -> str:
         """Get a random element from an array"""
@@ -86,43 +219,62 @@ class OSINTProfileGenerator:
         """Generate a random number between min and max"""
         return random.randint(min_val, max_val)
 
-    def generate_id(self) -> str:
+    def generate_id(self, timestamp: int = None) -> str:
         """Generate a unique ID"""
-        return f"ID-{int(datetime.now().timestamp())}-{str(uuid.uuid4())[:8]}"
+        if timestamp is None:
+            timestamp = int(datetime.now().timestamp())
+        import uuid
+        suffix = str(uuid.uuid4())[:8]
+        return f"ID-{timestamp}-{suffix}"
 
     def generate_phone_number(self) -> str:
         """Generate a realistic phone number"""
-        return f"+1-{self.generate_random_number(200, 999)}-{self.generate_random_number(200, 999)}-{self.generate_random_number(1000, 9999)}"
+        area, exchange = random.choices(range(200, 1000), k=2)
+        return f"+1-{area}-{exchange}-{random.randrange(1000, 10000)}"
+
+    def _company_domain(self, company: str) -> str:
+        """Get the domain for a company name"""
+        domain = self._company_domains.get(company)
+        if domain is None:
+            domain = company.lower().translate(_SLUG_TABLE) + '.com'
+        return domain
+
+    def _build_email(self, first_lower: str, last_lower: str, fmt: int, number: int, domain: str) -> str:
+        """Format an email address in one of the four local-part formats"""
+        if fmt == 0:
+            return f"{first_lower}.{last_lower}@{domain}"
+        if fmt == 1:
+            return f"{first_lower}{last_lower}@{domain}"
+        if fmt == 2:
+            return f"{first_lower[0]}{last_lower}@{domain}"
+        return f"{first_lower}{number}@{domain}"
 
     def generate_email(self, first_name: str, last_name: str, company: str = None) -> str:
         """Generate a realistic email address"""
-        formats = [
-            f"{first_name.lower()}.{last_name.lower()}",
-            f"{first_name.lower()}{last_name.lower()}",
-            f"{first_name[0].lower()}{last_name.lower()}",
-            f"{first_name.lower()}{self.generate_random_number(10, 99)}"
-        ]
-        
         if company and random.random() > 0.3:
             # Company email
-            domain = company.lower().replace(' ', '').replace(',', '').replace('.', '') + '.com'
+            domain = self._company_domain(company)
         else:
             # Personal email
             domain = self.get_random_element(self.sample_data['domains'])
         
-        return f"{random.choice(formats)}@{domain}"
+        return self._build_email(first_name.lower(), last_name.lower(),
+                                 random.randrange(4), self.generate_random_number(10, 99), domain)
 
     def generate_password(self, profile: Dict[str, Any]) -> str:
         """Generate a realistic password based on profile data"""
-        components = [
+        company = profile.get('company')
+        components = (
             profile['first_name'],
-            profile['last_name'], 
+            profile['last_name'],
             str(profile['birth_year']),
             profile['city'],
-            profile.get('company', 'work').split(' ')[0] if profile.get('company') else 'work'
-        ]
+            self._company_words.get(company) or company.split(' ')[0] if company else 'work'
+        )
         
-        return random.choice(components) + random.choice(components) + str(self.generate_random_number(10, 99))
+        # One uniform draw covers both component picks (5 x 5) and the suffix 10-99 (90)
+        r = random.randrange(5 * 5 * 90)
+        return f"{components[r % 5]}{components[r // 5 % 5]}{10 + r // 25}"
 
     def hash_password(self, password: str) -> str:
         """Generate SHA-512 hash of password"""
@@ -138,43 +290,104 @@ class OSINTProfileGenerator:
         if salt is None:
             salt = self.generate_salt()
         
-        # Combine password and salt
-        salted_password = password + salt
-        hash_value = hashlib.sha512(salted_password.encode()).hexdigest()
+        # Feed password then salt to the hash; equivalent to hashing password + salt
+        hasher = hashlib.sha512(password.encode())
+        hasher.update(salt.encode())
+        hash_value = hasher.hexdigest()
         
         return hash_value, salt
 
-    def generate_profile(self, use_salt: bool = False) -> Dict[str, Any]:
-        """Generate a single profile with all data"""
-        first_name = self.get_random_element(self.sample_data['first_names'])
-        last_name = self.get_random_element(self.sample_data['last_names'])
-        birth_year = self.generate_random_number(1970, 2000)
-        company = self.get_random_element(self.sample_data['companies'])
+    def _batch_sha512(self, messages: List[bytes]) -> List[str]:
+        """Generate SHA-512 hex digests for a batch of messages, in order"""
+        sha512 = hashlib.sha512
+        return [sha512(message).hexdigest() for message in messages]
+
+    def _batch_sample(self, n: int) -> Dict[str, list]:
+        """Draw the random fields for n profiles at once, one column per field"""
+        choices = random.choices
+        data = self.sample_data
+        # One clock reading for the whole batch
+        now = datetime.now()
+        last_active_dates = tuple((now - timedelta(days=days)).isoformat() for days in range(1, 31))
+        return {
+            'generated_at': now.isoformat(),
+            'timestamp': int(now.timestamp()),
+            'id_prefix': f"ID-{int(now.timestamp())}-",
+            # 4 random bytes (8 hex chars) for each of a profile's two IDs, in one draw
+            'id_hex': os.urandom(8 * n).hex(),
+            'first_names': choices(data['first_names'], k=n),
+            'last_names': choices(data['last_names'], k=n),
+            'companies': choices(data['companies'], k=n),
+            'job_titles': choices(data['job_titles'], k=n),
+            'cities': choices(data['cities'], k=n),
+            'universities': choices(data['universities'], k=n),
+            'personal_domains': choices(data['domains'], k=n),
+            'email_formats': choices(range(4), k=n),
+            'email_numbers': choices(range(10, 100), k=n),
+            'birth_years': choices(range(1970, 2001), k=n),
+            'birth_months': choices(range(1, 13), k=n),
+            'birth_days': choices(range(1, 29), k=n),
+            'graduation_years': choices(range(1990, 2021), k=n),
+            'phone_areas': choices(range(200, 1000), k=n),
+            'phone_exchanges': choices(range(200, 1000), k=n),
+            'phone_lines': choices(range(1000, 10000), k=n),
+            'pic_genders': choices(('men', 'women'), k=n),
+            'pic_numbers': choices(range(1, 100), k=n),
+            'linkedin_connections': choices(range(50, 501), k=n),
+            'posts': choices(range(10, 101), k=n),
+            'followers': choices(range(50, 1001), k=n),
+            'following': choices(range(30, 501), k=n),
+            'last_active': choices(last_active_dates, k=n),
+            # Two random bytes per profile for the weighted coin flips (email domain, GitHub)
+            'flip_bytes': (random.getrandbits(16 * n) if n else 0).to_bytes(2 * n, 'little')
+        }
+
+    def generate_profile(self, use_salt: bool = False, defer_hash: bool = False,
+                         sample: Dict[str, list] = None, i: int = 0) -> Dict[str, Any]:
+        """Generate a single profile with all data (password_hash left as None if defer_hash)"""
+        if sample is None:
+            sample = self._batch_sample(1)
+            i = 0
+        
+        first_name = sample['first_names'][i]
+        last_name = sample['last_names'][i]
+        birth_year = sample['birth_years'][i]
+        company = sample['companies'][i]
+        first_lower = first_name.lower()
+        last_lower = last_name.lower()
+        handle = first_lower + last_lower
+        
+        id_prefix = sample['id_prefix']
+        id_hex = sample['id_hex'][16 * i:16 * i + 16]
+        flip_bytes = sample['flip_bytes']
+        # Company email with p~0.7, otherwise a personal domain
+        domain = self._company_domain(company) if flip_bytes[2 * i] >= 77 else sample['personal_domains'][i]
         
         profile = {
-            'id': self.generate_id(),
+            'id': id_prefix + id_hex[:8],
             'first_name': first_name,
             'last_name': last_name,
             'full_name': f"{first_name} {last_name}",
-            'email': self.generate_email(first_name, last_name, company),
-            'phone': self.generate_phone_number(),
-            'birthdate': f"{self.generate_random_number(1, 12)}/{self.generate_random_number(1, 28)}/{birth_year}",
+            'email': self._build_email(first_lower, last_lower, sample['email_formats'][i],
+                                       sample['email_numbers'][i], domain),
+            'phone': f"+1-{sample['phone_areas'][i]}-{sample['phone_exchanges'][i]}-{sample['phone_lines'][i]}",
+            'birthdate': f"{sample['birth_months'][i]}/{sample['birth_days'][i]}/{birth_year}",
             'birth_year': birth_year,
             'age': 2025 - birth_year,
-            'job_title': self.get_random_element(self.sample_data['job_titles']),
+            'job_title': sample['job_titles'][i],
             'company': company,
-            'city': self.get_random_element(self.sample_data['cities']),
-            'university': self.get_random_element(self.sample_data['universities']),
-            'graduation_year': self.generate_random_number(1990, 2020),
-            'profile_pic': f"https://randomuser.me/api/portraits/{'men' if random.random() > 0.5 else 'women'}/{self.generate_random_number(1, 99)}.jpg",
-            'linkedin_connections': self.generate_random_number(50, 500),
+            'city': sample['cities'][i],
+            'university': sample['universities'][i],
+            'graduation_year': sample['graduation_years'][i],
+            'profile_pic': f"https://randomuser.me/api/portraits/{sample['pic_genders'][i]}/{sample['pic_numbers'][i]}.jpg",
+            'linkedin_connections': sample['linkedin_connections'][i],
             'social_profiles': {
-                'linkedin': f"https://linkedin.com/in/{first_name.lower()}-{last_name.lower()}",
-                'twitter': f"https://twitter.com/{first_name.lower()}{last_name.lower()}",
-                'github': f"https://github.com/{first_name.lower()}{last_name.lower()}" if random.random() > 0.4 else None
+                'linkedin': f"https://linkedin.com/in/{first_lower}-{last_lower}",
+                'twitter': f"https://twitter.com/{handle}",
+                'github': f"https://github.com/{handle}" if flip_bytes[2 * i + 1] >= 102 else None  # p~0.6
             },
-            'generated_at': datetime.now().isoformat(),
-            'url': f"/profiles/{self.generate_id()}"
+            'generated_at': sample['generated_at'],
+            'url': f"/profiles/{id_prefix}{id_hex[8:]}"
         }
 
         # Generate password and hash (with optional salt)
@@ -182,84 +395,195 @@ class OSINTProfileGenerator:
         profile['password_hint'] = password
         
         if use_salt:
-            hash_value, salt = self.hash_password_with_salt(password)
+            salt = sample['salts'][i] if 'salts' in sample else None
+            if defer_hash:
+                hash_value, salt = None, salt or self.generate_salt()
+            else:
+                hash_value, salt = self.hash_password_with_salt(password, salt)
             profile['password_hash'] = hash_value
             profile['salt'] = salt
             profile['hash_type'] = 'SHA-512_SALTED'
         else:
-            profile['password_hash'] = self.hash_password(password)
+            profile['password_hash'] = None if defer_hash else self.hash_password(password)
             profile['hash_type'] = 'SHA-512'
 
         return profile
 
-    def generate_company_profile(self) -> Dict[str, Any]:
-        """Generate a company profile"""
+    def generate_company_profile(self, sample: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Generate a company profile (sample only supplies the batch clock)"""
+        if sample is None:
+            now = datetime.now()
+            generated_at, timestamp = now.isoformat(), int(now.timestamp())
+        else:
+            generated_at, timestamp = sample['generated_at'], sample['timestamp']
+        
         company_name = self.get_random_element(self.sample_data['companies'])
         return {
-            'id': self.generate_id(),
+            'id': self.generate_id(timestamp),
             'name': company_name,
             'industry': self.get_random_element(self.sample_data['industries']),
-            'size': random.choice(['10-50', '51-200', '201-1000', '1000+']),
+            'size': random.choice(_COMPANY_SIZES),
             'location': self.get_random_element(self.sample_data['cities']),
-            'website': f"https://{company_name.lower().replace(' ', '').replace(',', '').replace('.', '')}.com",
+            'website': f"https://{self._company_domain(company_name)}",
             'employees': [],
-            'departments': ['Engineering', 'Sales', 'Marketing', 'HR', 'Finance'],
-            'generated_at': datetime.now().isoformat(),
-            'url': f"/companies/{self.generate_id()}"
+            'departments': _DEPARTMENTS,
+            'generated_at': generated_at,
+            'url': f"/companies/{self.generate_id(timestamp)}"
         }
 
-    def generate_social_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_social_profile(self, profile: Dict[str, Any],
+                                sample: Dict[str, list] = None, i: int = 0) -> Dict[str, Any]:
         """Generate social media data for a profile"""
+        if sample is None:
+            sample = self._batch_sample(1)
+            i = 0
+        
         return {
             'id': profile['id'],
             'person_id': profile['id'],
-            'posts': self.generate_random_number(10, 100),
-            'followers': self.generate_random_number(50, 1000),
-            'following': self.generate_random_number(30, 500),
-            'last_active': (datetime.now() - timedelta(days=self.generate_random_number(1, 30))).isoformat()
+            'posts': sample['posts'][i],
+            'followers': sample['followers'][i],
+            'following': sample['following'][i],
+            'last_active': sample['last_active'][i]
         }
 
+    def _derive_salts(self, n: int) -> List[str]:
+        """Derive n hex salts from one seed (synthetic data: one CSPRNG draw per batch)"""
+        import secrets
+        seed = secrets.token_bytes(32)
+        # Expand the seed into 16 bytes (32 hex characters) of salt per profile
+        salt_hex = hashlib.shake_256(seed).hexdigest(16 * n)
+        return [salt_hex[j:j + 32] for j in range(0, 32 * n, 32)]
+
+    def _generate_profiles(self, sample: Dict[str, Any], use_salt: bool,
+                           company_names: List[str]) -> None:
+        """Fill the preallocated profile lists in self.database from a drawn sample (hashes deferred)"""
+        num_profiles = len(sample['first_names'])
+        if company_names:
+            assigned_companies = random.choices(company_names, k=num_profiles)
+        
+        profiles = self.database['profiles']
+        social_profiles = self.database['social_profiles']
+        ages = [0] * num_profiles
+        companies = [None] * num_profiles
+        
+        # Progress lines every 10 profiles for small runs, every 25 (or 1/20th of
+        # the run, whichever is larger) for bigger ones, plus the last profile
+        checkpoints = set()
+        if num_profiles:
+            step = 10 if num_profiles < 100 else max(25, num_profiles // 20)
+            checkpoints = set(range(step - 1, num_profiles, step))
+            checkpoints.add(num_profiles - 1)
+        
+        for i in range(num_profiles):
+            profile = self.generate_profile(use_salt, defer_hash=True, sample=sample, i=i)
+            # Assign to a random company
+            if company_names:
+                profile['company'] = assigned_companies[i]
+            
+            profiles[i] = profile
+            ages[i] = profile['age']
+            companies[i] = profile['company']
+            
+            # Generate social profile
+            social = self.generate_social_profile(profile, sample, i)
+            social_profiles[i] = social
+            self._social_by_pid[social['person_id']] = social
+            
+            # Show progress
+            if i in checkpoints:
+                print(f"  Generated {i + 1}/{num_profiles} profiles...")
+        
+        # Fold the new profiles into the running aggregates with one sum and one update
+        self._age_n += num_profiles
+        self._age_sum += sum(ages)
+        self._company_counter.update(companies)
+
+    def clear(self) -> None:
+        """Remove all generated data"""
+        # Empty the existing lists in place so anything holding them sees the cleared state
+        for records in self.database.values():
+            records.clear()
+        self._social_by_pid = {}
+        self._age_n = 0
+        self._age_sum = 0
+        self._company_counter = Counter()
+
     def generate_dataset(self, num_profiles: int = 20, num_companies: int = 5, use_salt: bool = False) -> None:
         """Generate a complete dataset"""
-        self.database = {'profiles': [], 'companies': [], 'social_profiles': [], 'relationships': []}
+        # Start from empty indexes and aggregates; _generate_profiles folds the new profiles in
+        self.clear()
+        
+        # Reuse the database dict; size the lists up front and fill them by index
+        database = self.database
+        database['profiles'] = [None] * num_profiles
+        database['companies'] = [None] * num_companies
+        database['social_profiles'] = [None] * num_profiles
+        
+        # Phase 1: draw every profile's random fields (and the batch clock) up front
+        sample = self._batch_sample(num_profiles)
+        if use_salt:
+            sample['salts'] = self._derive_salts(num_profiles)
         
         print(f"\nGenerating {num_companies} companies...")
         
         # Generate companies first
         for i in range(num_companies):
-            self.database['companies'].append(self.generate_company_profile())
+            database['companies'][i] = self.generate_company_profile(sample)
+        company_names = [company['name'] for company in self.database['companies']]
         
         print(f"Generating {num_profiles} profiles{'with salted hashes' if use_salt else ''}...")
         
-        # Generate profiles and assign to companies
-        for i in range(num_profiles):
-            profile = self.generate_profile(use_salt)
-            # Assign to a random company
-            if self.database['companies']:
-                profile['company'] = random.choice(self.database['companies'])['name']
-            
-            self.database['profiles'].append(profile)
-            
-            # Generate social profile
-            self.database['social_profiles'].append(self.generate_social_profile(profile))
-            
-            # Show progress
-            if num_profiles >= 100:
-                # More frequent updates for larger datasets
-                if (i + 1) % 25 == 0 or i == num_profiles - 1:
-                    print(f"  Generated {i + 1}/{num_profiles} profiles...")
-            elif (i + 1) % 10 == 0 or i == num_profiles - 1:
-                print(f"  Generated {i + 1}/{num_profiles} profiles...")
+        # Phase 2: assemble profiles from the drawn columns and assign to companies
+        self._generate_profiles(sample, use_salt, company_names)
+        
+        # Hash all passwords in one batch now that every profile is built
+        profiles = self.database['profiles']
+        messages = [(p['password_hint'] + p.get('salt', '')).encode() for p in profiles]
+        for profile, hash_value in zip(profiles, self._batch_sha512(messages)):
+            profile['password_hash'] = hash_value
+
+    def profile_stats(self) -> tuple:
+        """Get (profile count, age sum, company Counter) for the current profiles without rescanning them"""
+        profiles = self.database['profiles']
+        if self._age_n != len(profiles):
+            # Changed outside generate_dataset/clear: rebuild like _social_lookup, reducing in C
+            self._age_n = len(profiles)
+            self._age_sum = sum(map(itemgetter('age'), profiles))
+            self._company_counter = Counter(map(itemgetter('company'), profiles))
+        return self._age_n, self._age_sum, self._company_counter
+
+    def _social_lookup(self) -> Dict[str, Dict[str, Any]]:
+        """Get the person_id -> social profile index, rebuilding it if the data changed"""
+        social_profiles = self.database['social_profiles']
+        if len(self._social_by_pid) != len(social_profiles):
+            self._social_by_pid = {s['person_id']: s for s in social_profiles}
+        return self._social_by_pid
+
+    def _default_filename(self, prefix: str, extension: str, now: datetime = None) -> str:
+        """Build a timestamped default filename for an export"""
+        return f"{prefix}_{(now or datetime.now()).strftime('%Y%m%d_%H%M%S')}.{extension}"
 
-    def export_json(self, filename: str = None) -> str:
-        """Export data to JSON format"""
+    def _open_export(self, filename: str, compress: bool = False, binary: bool = False):
+        """Open an export file for writing, gzip-compressed at level 1 when requested"""
+        if compress:
+            import gzip
+            if binary:
+                return gzip.open(filename, 'wb', compresslevel=1)
+            return gzip.open(filename, 'wt', encoding='utf-8', compresslevel=1)
+        if binary:
+            return open(filename, 'wb', buffering=_EXPORT_BUFFER_SIZE)
+        return open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE)
+
+    def export_json(self, filename: str = None, pretty: bool = True) -> str:
+        """Export data to JSON format (pretty=False writes compact JSON via the C encoder)"""
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"osint_profiles_{timestamp}.json"
+            filename = self._default_filename('osint_profiles', 'json', now)
         
         export_data = {
             'metadata': {
-                'exported_at': datetime.now().isoformat(),
+                'exported_at': now.isoformat(),
                 'total_profiles': len(self.database['profiles']),
                 'total_companies': len(self.database['companies']),
                 'format': 'OSINT_CLI_Export_v1.0',
@@ -268,152 +592,142 @@ class OSINTProfileGenerator:
             'data': self.database
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        # Encode to one string and write it once; json.dump() would issue a write per chunk
+        if pretty:
+            content = json.dumps(export_data, indent=2, ensure_ascii=False)
+        else:
+            content = json.dumps(export_data, ensure_ascii=False, separators=(',', ':'))
+        
+        with open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(content)
         
         return filename
 
-    def export_txt(self, filename: str = None) -> str:
-        """Export data to human-readable TXT format"""
+    def export_txt(self, filename: str = None, compress: bool = False) -> str:
+        """Export data to human-readable TXT format (gzip-compressed when compress=True)"""
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"osint_profiles_{timestamp}.txt"
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            # Header
-            f.write("="*80 + "\n")
-            f.write("OSINT TRAINING PROFILES - SYNTHETIC DATA\n")
-            f.write("="*80 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Profiles: {len(self.database['profiles'])}\n")
-            f.write(f"Total Companies: {len(self.database['companies'])}\n")
-            f.write("="*80 + "\n\n")
+            filename = self._default_filename('osint_profiles', 'txt', now)
+        if compress and not filename.endswith('.gz'):
+            filename += '.gz'
+        
+        social_by_pid = self._social_lookup()
+        rule = "-"*40 + "\n"
+        
+        # Build the whole document in memory and write it once
+        lines = []
+        append = lines.append
+        
+        # Header
+        append("="*80 + "\n")
+        append("OSINT TRAINING PROFILES - SYNTHETIC DATA\n")
+        append("="*80 + "\n")
+        append(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        append(f"Total Profiles: {len(self.database['profiles'])}\n")
+        append(f"Total Companies: {len(self.database['companies'])}\n")
+        append("="*80 + "\n\n")
+        
+        # Companies Section
+        append("COMPANIES\n")
+        append(rule)
+        for company in self.database['companies']:
+            append(f"Company: {company['name']}\n"
+                   f"Industry: {company['industry']}\n"
+                   f"Size: {company['size']}\n"
+                   f"Location: {company['location']}\n"
+                   f"Website: {company['website']}\n"
+                   f"ID: {company['id']}\n")
+            append(rule)
+        
+        append("\n\nPROFILES\n")
+        append("="*80 + "\n")
+        
+        # Profiles Section
+        for i, profile in enumerate(self.database['profiles'], 1):
+            social_profiles = profile['social_profiles']
+            append(f"\nPROFILE #{i:03d}\n")
+            append(rule)
             
-            # Companies Section
-            f.write("COMPANIES\n")
-            f.write("-"*40 + "\n")
-            for company in self.database['companies']:
-                f.write(f"Company: {company['name']}\n")
-                f.write(f"Industry: {company['industry']}\n")
-                f.write(f"Size: {company['size']}\n")
-                f.write(f"Location: {company['location']}\n")
-                f.write(f"Website: {company['website']}\n")
-                f.write(f"ID: {company['id']}\n")
-                f.write("-"*40 + "\n")
+            # Personal and contact information, professional details, education
+            append(f"Name: {profile['full_name']}\n"
+                   f"Age: {profile['age']} years old\n"
+                   f"Birthday: {profile['birthdate']}\n"
+                   f"City: {profile['city']}\n"
+                   f"Email: {profile['email']}\n"
+                   f"Phone: {profile['phone']}\n"
+                   f"Job Title: {profile['job_title']}\n"
+                   f"Company: {profile['company']}\n"
+                   f"University: {profile['university']}\n"
+                   f"Graduation Year: {profile['graduation_year']}\n")
             
-            f.write("\n\nPROFILES\n")
-            f.write("="*80 + "\n")
+            # Social Media
+            append(f"LinkedIn: {social_profiles['linkedin']}\n"
+                   f"LinkedIn Connections: {profile['linkedin_connections']}\n"
+                   f"Twitter: {social_profiles['twitter']}\n")
+            if social_profiles['github']:
+                append(f"GitHub: {social_profiles['github']}\n")
             
-            # Profiles Section
-            for i, profile in enumerate(self.database['profiles'], 1):
-                f.write(f"\nPROFILE #{i:03d}\n")
-                f.write("-"*40 + "\n")
-                
-                # Personal Information
-                f.write(f"Name: {profile['full_name']}\n")
-                f.write(f"Age: {profile['age']} years old\n")
-                f.write(f"Birthday: {profile['birthdate']}\n")
-                f.write(f"City: {profile['city']}\n")
-                
-                # Contact Information
-                f.write(f"Email: {profile['email']}\n")
-                f.write(f"Phone: {profile['phone']}\n")
-                
-                # Professional Information  
-                f.write(f"Job Title: {profile['job_title']}\n")
-                f.write(f"Company: {profile['company']}\n")
-                
-                # Education
-                f.write(f"University: {profile['university']}\n")
-                f.write(f"Graduation Year: {profile['graduation_year']}\n")
-                
-                # Social Media
-                f.write(f"LinkedIn: {profile['social_profiles']['linkedin']}\n")
-                f.write(f"LinkedIn Connections: {profile['linkedin_connections']}\n")
-                f.write(f"Twitter: {profile['social_profiles']['twitter']}\n")
-                if profile['social_profiles']['github']:
-                    f.write(f"GitHub: {profile['social_profiles']['github']}\n")
-                
-                # Security Data (for educational purposes)
-                f.write(f"Password Hint: {profile['password_hint']}\n")
-                f.write(f"Password Hash (SHA-512): {profile['password_hash']}\n")
-                
-                # Metadata
-                f.write(f"Profile ID: {profile['id']}\n")
-                f.write(f"Generated: {profile['generated_at']}\n")
-                f.write(f"Profile URL: {profile['url']}\n")
-                
-                # Social Media Stats
-                social = next((s for s in self.database['social_profiles'] if s['person_id'] == profile['id']), None)
-                if social:
-                    f.write(f"Posts: {social['posts']}\n")
-                    f.write(f"Followers: {social['followers']}\n")
-                    f.write(f"Following: {social['following']}\n")
-                    f.write(f"Last Active: {social['last_active']}\n")
-                
-                f.write("-"*40 + "\n")
+            # Security Data (for educational purposes) and metadata
+            append(f"Password Hint: {profile['password_hint']}\n"
+                   f"Password Hash (SHA-512): {profile['password_hash']}\n"
+                   f"Profile ID: {profile['id']}\n"
+                   f"Generated: {profile['generated_at']}\n"
+                   f"Profile URL: {profile['url']}\n")
+            
+            # Social Media Stats
+            social = social_by_pid.get(profile['id'])
+            if social:
+                append(f"Posts: {social['posts']}\n"
+                       f"Followers: {social['followers']}\n"
+                       f"Following: {social['following']}\n"
+                       f"Last Active: {social['last_active']}\n")
+            
+            append(rule)
+        
+        with self._open_export(filename, compress) as f:
+            f.write(''.join(lines))
         
         return filename
 
     def export_csv(self, filename: str = None) -> str:
         """Export profiles to CSV format"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"osint_profiles_{timestamp}.csv"
-        
-        headers = [
-            'ID', 'FullName', 'FirstName', 'LastName', 'Email', 'Phone', 'Age', 'Birthdate',
-            'Company', 'JobTitle', 'City', 'University', 'GraduationYear', 'LinkedInConnections',
-            'LinkedIn', 'Twitter', 'GitHub', 'PasswordHint', 'PasswordHash', 'ProfileURL',
-            'Posts', 'Followers', 'Following', 'LastActive', 'GeneratedAt'
-        ]
+            filename = self._default_filename('osint_profiles', 'csv')
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(','.join(headers) + '\n')
-            
+        social_by_pid = self._social_lookup()
+        
+        def rows():
             for profile in self.database['profiles']:
-                social = next((s for s in self.database['social_profiles'] if s['person_id'] == profile['id']), {})
-                
-                row = [
-                    profile['id'],
-                    f'"{profile["full_name"]}"',
-                    f'"{profile["first_name"]}"', 
-                    f'"{profile["last_name"]}"',
-                    f'"{profile["email"]}"',
-                    f'"{profile["phone"]}"',
-                    str(profile['age']),
-                    f'"{profile["birthdate"]}"',
-                    f'"{profile["company"]}"',
-                    f'"{profile["job_title"]}"',
-                    f'"{profile["city"]}"',
-                    f'"{profile["university"]}"',
-                    str(profile['graduation_year']),
-                    str(profile['linkedin_connections']),
-                    f'"{profile["social_profiles"]["linkedin"]}"',
-                    f'"{profile["social_profiles"]["twitter"]}"',
-                    f'"{profile["social_profiles"]["github"] or ""}"',
-                    f'"{profile["password_hint"]}"',
-                    f'"{profile["password_hash"]}"',
-                    f'"{profile["url"]}"',
-                    str(social.get('posts', 0)),
-                    str(social.get('followers', 0)),
-                    str(social.get('following', 0)),
-                    f'"{social.get("last_active", "")}"',
-                    f'"{profile["generated_at"]}"'
-                ]
-                
-                f.write(','.join(row) + '\n')
+                social = social_by_pid.get(profile['id'], {})
+                social_profiles = profile['social_profiles']
+                yield (
+                    profile['id'], profile['full_name'], profile['first_name'], profile['last_name'],
+                    profile['email'], profile['phone'], profile['age'], profile['birthdate'],
+                    profile['company'], profile['job_title'], profile['city'], profile['university'],
+                    profile['graduation_year'], profile['linkedin_connections'],
+                    social_profiles['linkedin'], social_profiles['twitter'], social_profiles['github'] or '',
+                    profile['password_hint'], profile['password_hash'], profile['url'],
+                    social.get('posts', 0), social.get('followers', 0), social.get('following', 0),
+                    social.get('last_active', ''), profile['generated_at']
+                )
+        
+        # csv handles quoting/escaping; text fields are quoted, numbers are not
+        import csv
+        with open(filename, 'w', encoding='utf-8', newline='', buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(','.join(self.CSV_HEADERS) + '\n')
+            writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+            writer.writerows(rows())
         
         return filename
 
     def generate_html_visualizer(self, filename: str = None) -> str:
         """Generate an HTML file to visualize the profiles"""
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"osint_profiles_{timestamp}.html"
+            filename = self._default_filename('osint_profiles', 'html', now)
         
-        # Build HTML content using string concatenation to avoid f-string issues
-        html_content = '''<!DOCTYPE html>
+        # Build the page head from a list of parts joined once (no f-strings: the CSS uses braces)
+        parts = ['''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -585,18 +899,26 @@ class OSINTProfileGenerator:
     <div class="container">
         <div class="header">
             <h1>OSINT Profiles Visualizer</h1>
-            <p>Generated on ''' + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + '''</p>
+            <p>Generated on ''',
+            now.strftime('%Y-%m-%d %H:%M:%S'),
+            '''</p>
             <div class="stats">
                 <div class="stat-card">
-                    <div class="stat-number">''' + str(len(self.database['profiles'])) + '''</div>
+                    <div class="stat-number">''',
+            str(len(self.database['profiles'])),
+            '''</div>
                     <div class="stat-label">Total Profiles</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">''' + str(len(self.database['companies'])) + '''</div>
+                    <div class="stat-number">''',
+            str(len(self.database['companies'])),
+            '''</div>
                     <div class="stat-label">Companies</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-number">''' + str(len(self.database['social_profiles'])) + '''</div>
+                    <div class="stat-number">''',
+            str(len(self.database['social_profiles'])),
+            '''</div>
                     <div class="stat-label">Social Profiles</div>
                 </div>
             </div>
@@ -609,13 +931,24 @@ class OSINTProfileGenerator:
             </div>
             <input type="text" class="search-box" placeholder="Search profiles..." onkeyup="searchProfiles(this.value)">
             <div id="profiles" class="tab-content active">
-                <div class="profile-grid">''' + self._generate_profile_cards() + '''</div>
+                <div class="profile-grid">''']
+        
+        # Cards are written straight to the file instead of being joined into one big string
+        with open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+            write = f.write
+            write(''.join(parts))
+            self._generate_profile_cards(write)
+            write('''</div>
             </div>
             <div id="companies" class="tab-content">
-                <div class="profile-grid">''' + self._generate_company_cards() + '''</div>
+                <div class="profile-grid">''')
+            self._generate_company_cards(write)
+            write('''</div>
             </div>
             <div id="social" class="tab-content">
-                <div class="profile-grid">''' + self._generate_social_cards() + '''</div>
+                <div class="profile-grid">''')
+            self._generate_social_cards(write)
+            write('''</div>
             </div>
         </div>
     </div>
@@ -639,43 +972,41 @@ class OSINTProfileGenerator:
         }
     </script>
 </body>
-</html>'''
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+</html>''')
         
         return filename
 
     def export_hashes_only(self, filename: str = None) -> str:
         """Export only password hashes for hash cracking practice"""
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"osint_hashes_{timestamp}.txt"
+            filename = self._default_filename('osint_hashes', 'txt', now)
         
         if not self.database['profiles']:
             raise ValueError("No profiles available. Generate profiles first.")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("# OSINT Training Password Hashes (SHA-512)\n")
-            f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"# Total hashes: {len(self.database['profiles'])}\n")
-            f.write("# Educational use only - for password cracking training\n")
-            f.write("#" + "="*60 + "\n")
-            f.write("# Format: username:hash\n")
-            f.write("#" + "="*60 + "\n\n")
-            
-            for profile in self.database['profiles']:
-                username = profile['email'].split('@')[0]  # Use email prefix as username
-                password_hash = profile['password_hash']
-                f.write(f"{username}:{password_hash}\n")
+        header = (
+            "# OSINT Training Password Hashes (SHA-512)\n"
+            f"# Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"# Total hashes: {len(self.database['profiles'])}\n"
+            "# Educational use only - for password cracking training\n"
+            "#" + "="*60 + "\n"
+            "# Format: username:hash\n"
+            "#" + "="*60 + "\n\n"
+        )
+        # Use email prefix as username
+        lines = [f"{p['email'].partition('@')[0]}:{p['password_hash']}\n" for p in self.database['profiles']]
+        
+        with open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(header)
+            f.writelines(lines)
         
         return filename
 
     def export_salted_hashcat_format(self, filename: str = None) -> str:
         """Export salted hashes in hashcat format (hash:salt)"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"hashcat_salted_{timestamp}.txt"
+            filename = self._default_filename('hashcat_salted', 'txt')
         
         if not self.database['profiles']:
             raise ValueError("No profiles available. Generate profiles first.")
@@ -684,17 +1015,16 @@ class OSINTProfileGenerator:
         if not salted_profiles:
             raise ValueError("No salted hashes found. Generate profiles with salt option enabled.")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            for profile in salted_profiles:
-                f.write(f"{profile['password_hash']}:{profile['salt']}\n")
+        with open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.writelines([f"{p['password_hash']}:{p['salt']}\n" for p in salted_profiles])
         
         return filename
 
     def export_salt_reference(self, filename: str = None) -> str:
         """Export salt reference file with hash:salt:password mapping"""
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"salt_reference_{timestamp}.txt"
+            filename = self._default_filename('salt_reference', 'txt', now)
         
         if not self.database['profiles']:
             raise ValueError("No profiles available. Generate profiles first.")
@@ -703,276 +1033,318 @@ class OSINTProfileGenerator:
         if not salted_profiles:
             raise ValueError("No salted hashes found. Generate profiles with salt option enabled.")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("# OSINT Training Salted Hash Reference\n")
-            f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"# Total entries: {len(salted_profiles)}\n")
-            f.write("# Format: username | hash | salt | password_hint | full_name\n")
-            f.write("#" + "="*80 + "\n\n")
-            
-            for profile in salted_profiles:
-                username = profile['email'].split('@')[0]
-                f.write(f"{username} | {profile['password_hash']} | {profile['salt']} | {profile['password_hint']} | {profile['full_name']}\n")
+        header = (
+            "# OSINT Training Salted Hash Reference\n"
+            f"# Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"# Total entries: {len(salted_profiles)}\n"
+            "# Format: username | hash | salt | password_hint | full_name\n"
+            "#" + "="*80 + "\n\n"
+        )
+        lines = [
+            f"{p['email'].partition('@')[0]} | {p['password_hash']} | {p['salt']} | {p['password_hint']} | {p['full_name']}\n"
+            for p in salted_profiles
+        ]
+        
+        with open(filename, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+            f.write(header)
+            f.writelines(lines)
         
         return filename
 
-    def export_hashcat_format(self, filename: str = None) -> str:
+    def export_hashcat_format(self, filename: str = None, compress: bool = False) -> str:
         """Export hashes in clean hashcat format (hash only, no usernames or metadata)"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"hashcat_hashes_{timestamp}.txt"
+            filename = self._default_filename('hashcat_hashes', 'txt')
+        if compress and not filename.endswith('.gz'):
+            filename += '.gz'
         
         if not self.database['profiles']:
             raise ValueError("No profiles available. Generate profiles first.")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            for profile in self.database['profiles']:
-                f.write(f"{profile['password_hash']}\n")
+        # Hex digests are pure ASCII: encode once and skip the text layer
+        hashes = '\n'.join([p['password_hash'] for p in self.database['profiles']])
+        with self._open_export(filename, compress, binary=True) as f:
+            f.write(hashes.encode('ascii'))
+            f.write(b'\n')
         
         return filename
 
-    def export_hash_reference(self, filename: str = None) -> str:
+    def export_hash_reference(self, filename: str = None, compress: bool = False) -> str:
         """Export hash reference file with hints for educational purposes"""
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"osint_hash_reference_{timestamp}.txt"
+            filename = self._default_filename('osint_hash_reference', 'txt', now)
+        if compress and not filename.endswith('.gz'):
+            filename += '.gz'
         
         if not self.database['profiles']:
             raise ValueError("No profiles available. Generate profiles first.")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("# OSINT Training Hash Reference File\n")
-            f.write(f"# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"# Total entries: {len(self.database['profiles'])}\n")
-            f.write("# Educational use only - shows hash:password mapping for training\n")
-            f.write("#" + "="*70 + "\n")
-            f.write("# Format: username | hash | password_hint | full_name\n")
-            f.write("#" + "="*70 + "\n\n")
-            
-            for profile in self.database['profiles']:
-                username = profile['email'].split('@')[0]
-                password_hash = profile['password_hash']
-                password_hint = profile['password_hint']
-                full_name = profile['full_name']
-                f.write(f"{username} | {password_hash} | {password_hint} | {full_name}\n")
+        header = (
+            "# OSINT Training Hash Reference File\n"
+            f"# Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"# Total entries: {len(self.database['profiles'])}\n"
+            "# Educational use only - shows hash:password mapping for training\n"
+            "#" + "="*70 + "\n"
+            "# Format: username | hash | password_hint | full_name\n"
+            "#" + "="*70 + "\n\n"
+        )
+        lines = [
+            f"{p['email'].partition('@')[0]} | {p['password_hash']} | {p['password_hint']} | {p['full_name']}\n"
+            for p in self.database['profiles']
+        ]
+        
+        with self._open_export(filename, compress) as f:
+            f.write(header)
+            f.writelines(lines)
         
         return filename
 
-    def generate_wordlist_from_json(self, json_filename: str, wordlist_filename: str = None) -> str:
-        """Generate a wordlist from existing JSON file for password cracking training"""
-        if not wordlist_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            wordlist_filename = f"osint_wordlist_{timestamp}.txt"
+    def _stream_profiles_from_json(self, json_filename: str, ijson) -> Iterator[Dict[str, Any]]:
+        """Yield profiles one at a time from an exported JSON file using ijson"""
+        with open(json_filename, 'rb') as f:
+            try:
+                yield from ijson.items(f, 'data.profiles.item')
+            except ijson.JSONError:
+                raise ValueError(f"Invalid JSON file: '{json_filename}'")
+
+    def _load_profiles_from_json(self, json_filename: str) -> Iterable[Dict[str, Any]]:
+        """Load the profile list from an exported JSON file (streamed when ijson is installed)"""
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+        
+        if ijson is not None:
+            profiles = self._stream_profiles_from_json(json_filename, ijson)
+            try:
+                first = next(profiles, None)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"JSON file '{json_filename}' not found")
+            if first is None:
+                raise ValueError("No profiles found in JSON file")
+            return chain((first,), profiles)
         
         try:
-            # Load JSON data
             with open(json_filename, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON file '{json_filename}' not found")
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON file: '{json_filename}'")
+        
+        profiles = data.get('data', {}).get('profiles', [])
+        if not profiles:
+            raise ValueError("No profiles found in JSON file")
+        return profiles
+
+    def generate_wordlist_from_json(self, json_filename: str, wordlist_filename: str = None,
+                                    compress: bool = False) -> str:
+        """Generate a wordlist from existing JSON file for password cracking training"""
+        return self.generate_wordlist_info_from_json(json_filename, wordlist_filename, compress)[0]
+
+    def generate_wordlist_info_from_json(self, json_filename: str, wordlist_filename: str = None,
+                                         compress: bool = False, arrow: bool = False) -> tuple:
+        """Generate a wordlist from a JSON file and return (filename, entry count, first entries)"""
+        if not wordlist_filename:
+            wordlist_filename = self._default_filename('osint_wordlist', 'arrow' if arrow else 'txt')
+        self._check_wordlist_output(wordlist_filename, compress)
+        
+        profiles = self._load_profiles_from_json(json_filename)
+        return self._build_wordlist(profiles, wordlist_filename, json_filename, compress)
+
+    def _build_wordlist(self, profiles: Iterable[Dict[str, Any]], wordlist_filename: str,
+                        source: str = "current profile data", compress: bool = False) -> tuple:
+        """Write a wordlist of password candidates derived from the given profiles (.arrow names
+        write Arrow IPC) and return (filename, entry count, first entries)"""
+        arrow = wordlist_filename.endswith('.arrow')
+        if compress and not wordlist_filename.endswith('.gz'):
+            wordlist_filename += '.gz'
+        
+        wordlist_entries = []  # Deduplicated in insertion order below
+        add_entry = wordlist_entries.append
+        
+        # Variants depend only on the word and birth year, so repeated names/cities/companies
+        # are expanded once instead of producing the same entries again
+        seen_bases = set()
+        seen_pairs = set()
+        suffixes_by_year = {}
+        
+        # Generate wordlist entries from profile data
+        for profile in profiles:
+            # Add the actual password hint
+            if 'password_hint' in profile:
+                add_entry(profile['password_hint'])
             
-            profiles = data.get('data', {}).get('profiles', [])
-            if not profiles:
-                raise ValueError("No profiles found in JSON file")
-            
-            wordlist_entries = set()  # Use set to avoid duplicates
-            
-            # Generate wordlist entries from profile data
-            for profile in profiles:
-                # Add the actual password hint
-                if 'password_hint' in profile:
-                    wordlist_entries.add(profile['password_hint'])
-                
-                # Generate common password variations from profile data
-                first_name = profile.get('first_name', '')
-                last_name = profile.get('last_name', '')
-                birth_year = str(profile.get('birth_year', ''))
-                city = profile.get('city', '')
-                company = profile.get('company', '').split(' ')[0] if profile.get('company') else ''
-                university = profile.get('university', '').replace(' University', '').replace(' ', '') if profile.get('university') else ''
-                
-                # Common password patterns
-                base_elements = [first_name, last_name, city, company, university]
-                numbers = [birth_year, birth_year[-2:] if len(birth_year) >= 2 else '', '123', '1234', '12345']
-                common_suffixes = ['!', '@', '#', '01', '02', '03', '99', '00']
-                
-                # Generate combinations
-                for base in base_elements:
-                    if base:
-                        base_lower = base.lower()
-                        base_cap = base.capitalize()
-                        
-                        # Just the base word
-                        wordlist_entries.add(base_lower)
-                        wordlist_entries.add(base_cap)
-                        
-                        # Base + numbers
-                        for num in numbers:
-                            if num:
-                                wordlist_entries.add(base_lower + num)
-                                wordlist_entries.add(base_cap + num)
-                        
-                        # Base + common suffixes
-                        for suffix in common_suffixes:
-                            wordlist_entries.add(base_lower + suffix)
-                            wordlist_entries.add(base_cap + suffix)
-                        
-                        # Base + year + suffix combinations
-                        if birth_year:
-                            for suffix in ['!', '@', '#']:
-                                wordlist_entries.add(base_lower + birth_year + suffix)
-                                wordlist_entries.add(base_cap + birth_year + suffix)
-                
-                # Two-word combinations (most common actual pattern)
-                for base1 in [first_name, last_name]:
-                    for base2 in [last_name, city, company]:
-                        if base1 and base2 and base1 != base2:
-                            for num in ['', birth_year[-2:] if len(birth_year) >= 2 else '', '123']:
-                                combo = base1.lower() + base2.lower() + num
-                                wordlist_entries.add(combo)
-                                combo_cap = base1.capitalize() + base2.capitalize() + num
-                                wordlist_entries.add(combo_cap)
+            # Generate common password variations from profile data
+            first_name = profile.get('first_name', '')
+            last_name = profile.get('last_name', '')
+            birth_year = str(profile.get('birth_year', ''))
+            city = profile.get('city', '')
+            company = profile.get('company', '').split(' ')[0] if profile.get('company') else ''
+            university = profile.get('university', '').replace(' University', '').replace(' ', '') if profile.get('university') else ''
             
-            # Sort wordlist by length then alphabetically for better organization
-            sorted_wordlist = sorted(list(wordlist_entries), key=lambda x: (len(x), x.lower()))
+            # Common password patterns: base + numbers, common suffixes and year + suffix
+            base_elements = (first_name, last_name, city, company, university)
+            year_short = birth_year[-2:] if len(birth_year) >= 2 else ''
+            base_suffixes = suffixes_by_year.get(birth_year)
+            if base_suffixes is None:
+                year_numbers = tuple(num for num in (birth_year, year_short) if num)
+                base_suffixes = year_numbers + _WORDLIST_NUMBERS + _WORDLIST_SUFFIXES
+                if birth_year:
+                    base_suffixes += tuple(birth_year + suffix for suffix in _WORDLIST_YEAR_SUFFIXES)
+                suffixes_by_year[birth_year] = base_suffixes
             
-            # Write wordlist file
-            with open(wordlist_filename, 'w', encoding='utf-8') as f:
-                f.write(f"# OSINT Training Wordlist\n")
-                f.write(f"# Generated from: {json_filename}\n")
-                f.write(f"# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Total entries: {len(sorted_wordlist)}\n")
-                f.write(f"# Educational use only - for password security training\n")
-                f.write("#" + "="*60 + "\n\n")
-                
-                for entry in sorted_wordlist:
-                    f.write(entry + '\n')
+            # Generate combinations
+            for base in base_elements:
+                if base and (base, birth_year) not in seen_bases:
+                    seen_bases.add((base, birth_year))
+                    base_lower = base.lower()
+                    base_cap = base.capitalize()
+                    
+                    # Just the base word
+                    add_entry(base_lower)
+                    add_entry(base_cap)
+                    
+                    # Base + every suffix
+                    for suffix in base_suffixes:
+                        add_entry(base_lower + suffix)
+                        add_entry(base_cap + suffix)
             
-            return wordlist_filename
+            # Two-word combinations (most common actual pattern)
+            combo_numbers = ('', year_short, '123')
+            for base1, base2 in product((first_name, last_name), (last_name, city, company)):
+                if base1 and base2 and base1 != base2 and (base1, base2, birth_year) not in seen_pairs:
+                    seen_pairs.add((base1, base2, birth_year))
+                    combo = f"{base1.lower()}{base2.lower()}"
+                    combo_cap = f"{base1.capitalize()}{base2.capitalize()}"
+                    for num in combo_numbers:
+                        add_entry(combo + num)
+                        add_entry(combo_cap + num)
+        
+        # Sort wordlist by length then alphabetically for better organization
+        # (dict.fromkeys keeps first-seen order, so ties sort the same way on every run).
+        # Two stable sorts with C-level keys give the same order as key=(len, lower).
+        sorted_wordlist = sorted(dict.fromkeys(wordlist_entries), key=str.lower)
+        sorted_wordlist.sort(key=len)
+        
+        # Write wordlist file
+        if arrow:
+            self._write_wordlist_arrow(wordlist_filename, sorted_wordlist, source)
+        else:
+            with self._open_export(wordlist_filename, compress) as f:
+                f.write(
+                    "# OSINT Training Wordlist\n"
+                    f"# Generated from: {source}\n"
+                    f"# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"# Total entries: {len(sorted_wordlist)}\n"
+                    "# Educational use only - for password security training\n"
+                    + "#" + "="*60 + "\n\n"
+                )
             
-        except FileNotFoundError:
-            raise FileNotFoundError(f"JSON file '{json_filename}' not found")
-        except json.JSONDecodeError:
-            raise ValueError(f"Invalid JSON file: '{json_filename}'")
+                # One joined write per chunk keeps the temporary string bounded on large wordlists
+                for start in range(0, len(sorted_wordlist), _WORDLIST_WRITE_CHUNK):
+                    f.write('\n'.join(sorted_wordlist[start:start + _WORDLIST_WRITE_CHUNK]))
+                    f.write('\n')
+        
+        return wordlist_filename, len(sorted_wordlist), sorted_wordlist[:_WORDLIST_PREVIEW_SIZE]
+
+    def _check_wordlist_output(self, wordlist_filename: str, compress: bool) -> None:
+        """Reject unsupported wordlist output before any profiles are read"""
+        if not wordlist_filename.endswith('.arrow'):
+            return
+        if compress:
+            raise ValueError("Arrow wordlists cannot be gzip-compressed")
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("Arrow wordlist output requires pyarrow (pip install pyarrow)")
+
+    def _write_wordlist_arrow(self, wordlist_filename: str, entries: List[str], source: str) -> None:
+        """Write wordlist entries as a one-column Arrow IPC stream"""
+        import pyarrow as pa
+        
+        # The text header becomes schema metadata so readers get it without parsing
+        schema = pa.schema([pa.field('candidate', pa.string())], metadata={
+            'generated_from': source,
+            'generated_on': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'total_entries': str(len(entries)),
+        })
+        batch = pa.record_batch([pa.array(entries, type=pa.string())], schema=schema)
+        with pa.OSFile(wordlist_filename, 'wb') as sink:
+            with pa.ipc.new_stream(sink, schema) as writer:
+                writer.write_batch(batch)
 
-    def generate_wordlist_from_current_data(self, wordlist_filename: str = None) -> str:
+    def generate_wordlist_from_current_data(self, wordlist_filename: str = None,
+                                            compress: bool = False) -> str:
         """Generate wordlist from currently loaded profile data"""
+        return self.generate_wordlist_info_from_current_data(wordlist_filename, compress)[0]
+
+    def generate_wordlist_info_from_current_data(self, wordlist_filename: str = None,
+                                                 compress: bool = False, arrow: bool = False) -> tuple:
+        """Generate a wordlist from the loaded profiles and return (filename, entry count, first entries)"""
         if not self.database['profiles']:
             raise ValueError("No profiles loaded. Generate profiles first.")
         
         if not wordlist_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            wordlist_filename = f"osint_wordlist_{timestamp}.txt"
-        
-        # Create temporary JSON structure and use existing method
-        temp_data = {
-            'data': {
-                'profiles': self.database['profiles']
-            }
-        }
+            wordlist_filename = self._default_filename('osint_wordlist', 'arrow' if arrow else 'txt')
+        self._check_wordlist_output(wordlist_filename, compress)
         
-        # Write temporary JSON
-        temp_json = f"temp_wordlist_{timestamp}.json"
-        with open(temp_json, 'w', encoding='utf-8') as f:
-            json.dump(temp_data, f)
-        
-        try:
-            # Generate wordlist from temp JSON
-            result = self.generate_wordlist_from_json(temp_json, wordlist_filename)
-            return result
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_json):
-                os.remove(temp_json)
-
-    def _generate_profile_cards(self) -> str:
-        """Generate HTML for profile cards"""
-        cards = []
+        return self._build_wordlist(self.database['profiles'], wordlist_filename, compress=compress)
+
+    def _generate_profile_cards(self, write: Callable[[str], Any]) -> None:
+        """Write HTML for profile cards"""
+        social_by_pid = self._social_lookup()
+        render = _PROFILE_CARD_TEMPLATE.format
         for profile in self.database['profiles']:
-            social = next((s for s in self.database['social_profiles'] if s['person_id'] == profile['id']), {})
-            
-            card = '<div class="profile-card" data-person-id="' + profile['id'] + '">'
-            card += '<div class="profile-header">'
-            card += '<img src="' + profile['profile_pic'] + '" alt="' + profile['full_name'] + '" class="profile-pic">'
-            card += '<div>'
-            card += '<div class="profile-name">' + profile['full_name'] + '</div>'
-            card += '<div class="profile-title">' + profile['job_title'] + '</div>'
-            card += '<div class="profile-meta">' + profile['company'] + ' • ' + profile['city'] + '</div>'
-            card += '</div></div>'
-            card += '<div class="profile-details">'
-            card += '<div class="detail-item"><div class="detail-label">Email:</div>' + profile['email'] + '</div>'
-            card += '<div class="detail-item"><div class="detail-label">Age:</div>' + str(profile['age']) + ' years old</div>'
-            card += '<div class="detail-item"><div class="detail-label">University:</div>' + profile['university'] + '</div>'
-            card += '<div class="detail-item"><div class="detail-label">LinkedIn:</div>' + str(profile['linkedin_connections']) + ' connections</div>'
-            card += '<div class="detail-item"><div class="detail-label">Posts:</div>' + str(social.get('posts', 0)) + '</div>'
-            card += '<div class="detail-item"><div class="detail-label">Followers:</div>' + str(social.get('followers', 0)) + '</div>'
-            card += '</div></div>'
-            
-            cards.append(card)
-        
-        return ''.join(cards)
+            social = social_by_pid.get(profile['id'], {})
+            write(render(p=profile, posts=social.get('posts', 0), followers=social.get('followers', 0)))
 
-    def _generate_company_cards(self) -> str:
-        """Generate HTML for company cards"""
-        cards = []
+    def _generate_company_cards(self, write: Callable[[str], Any]) -> None:
+        """Write HTML for company cards"""
+        render = _COMPANY_CARD_TEMPLATE.format
+        employees_by_company = defaultdict(list)
+        for profile in self.database['profiles']:
+            employees_by_company[profile['company']].append(profile)
+        
         for company in self.database['companies']:
-            employees = [p for p in self.database['profiles'] if p['company'] == company['name']]
+            employees = employees_by_company[company['name']]
             
-            card = '<div class="profile-card company-card" data-company-id="' + company['id'] + '">'
-            card += '<div class="profile-header">'
-            card += '<div style="width: 60px; height: 60px; background: rgba(255,255,255,0.2); border-radius: 10px; display: flex; align-items: center; justify-content: center; color: white; font-weight: bold; font-size: 18px;">'
-            card += company['name'][0] + '</div>'
-            card += '<div>'
-            card += '<div class="profile-name">' + company['name'] + '</div>'
-            card += '<div class="profile-title">' + company['industry'] + '</div>'
-            card += '<div class="profile-meta">' + company['location'] + ' • ' + str(len(employees)) + ' employees</div>'
-            card += '</div></div>'
-            card += '<div class="profile-details">'
-            card += '<div class="detail-item"><div class="detail-label">Size:</div>' + company['size'] + '</div>'
-            card += '<div class="detail-item"><div class="detail-label">Website:</div>' + company['website'] + '</div>'
-            card += '<div class="detail-item"><div class="detail-label">Departments:</div>' + str(len(company['departments'])) + '</div>'
-            card += '<div class="detail-item" style="grid-column: span 2;"><div class="detail-label">Recent Employees:</div>'
-            card += ', '.join([emp['full_name'] for emp in employees[:3]])
-            if len(employees) > 3:
-                card += ' and ' + str(len(employees) - 3) + ' more'
-            card += '</div></div></div>'
-            
-            cards.append(card)
-        
-        return ''.join(cards)
+            write(render(
+                c=company,
+                initial=company['name'][0],
+                employee_count=len(employees),
+                department_count=len(company['departments']),
+                recent=', '.join([emp['full_name'] for emp in employees[:3]]),
+                more=f" and {len(employees) - 3} more" if len(employees) > 3 else ''
+            ))
 
-    def _generate_social_cards(self) -> str:
-        """Generate HTML for social media cards"""
-        cards = []
+    def _generate_social_cards(self, write: Callable[[str], Any]) -> None:
+        """Write HTML for social media cards"""
+        get_social = self._social_lookup().get
+        render = _SOCIAL_CARD_TEMPLATE.format
         for profile in self.database['profiles']:
-            social = next((s for s in self.database['social_profiles'] if s['person_id'] == profile['id']), None)
+            social = get_social(profile['id'])
             if not social:
                 continue
-                
-            card = '<div class="profile-card" data-person-id="' + profile['id'] + '">'
-            card += '<div class="profile-header">'
-            card += '<img src="' + profile['profile_pic'] + '" alt="' + profile['full_name'] + '" class="profile-pic">'
-            card += '<div>'
-            card += '<div class="profile-name">@' + profile['first_name'].lower() + profile['last_name'].lower() + '</div>'
-            card += '<div class="profile-title">' + profile['full_name'] + '</div>'
-            card += '<div class="profile-meta">' + str(social['followers']) + ' followers • ' + str(social['posts']) + ' posts</div>'
-            card += '</div></div>'
-            card += '<div class="profile-details">'
-            card += '<div class="detail-item"><div class="detail-label">Posts:</div>' + str(social['posts']) + '</div>'
-            card += '<div class="detail-item"><div class="detail-label">Followers:</div>' + str(social['followers']) + '</div>'
-            card += '<div class="detail-item"><div class="detail-label">Following:</div>' + str(social['following']) + '</div>'
-            card += '<div class="detail-item"><div class="detail-label">Last Active:</div>' + datetime.fromisoformat(social['last_active']).strftime('%m/%d') + '</div>'
-            card += '<div class="detail-item" style="grid-column: span 2;"><div class="detail-label">Social Links:</div>LinkedIn, Twitter'
-            if profile['social_profiles']['github']:
-                card += ', GitHub'
-            card += '</div></div></div>'
             
-            cards.append(card)
-        
-        return ''.join(cards)
+            last_active = social['last_active']
+            has_github = profile['social_profiles']['github']
+            write(render(
+                p=profile,
+                s=social,
+                handle=f"{profile['first_name']}{profile['last_name']}".lower(),
+                # ISO 8601: month and day sit at fixed offsets, no datetime round trip needed
+                last_active=f"{last_active[5:7]}/{last_active[8:10]}",
+                github=', GitHub' if has_github else ''
+            ))
 
 
 class MenuInterface:
     def __init__(self):
         self.generator = OSINTProfileGenerator()
+        # (console encoding, encoded banner) for print_banner
+        self._banner_bytes = (None, b'')
         self.clear_screen()
 
     def clear_screen(self):
@@ -980,40 +1352,48 @@ class MenuInterface:
         os.system('cls' if os.name == 'nt' else 'clear')
 
     def print_banner(self):
-        """Print the application banner"""
-        print("="*60)
-        print("🔍 OSINT PROFILE GENERATOR CLI")
-        print("Educational Synthetic Data Generator for OSINT Training")
-        print("="*60)
-        print()
+        """Print the application banner (pre-encoded once for the console's codec)"""
+        stdout = sys.stdout
+        buffer = getattr(stdout, 'buffer', None)
+        if buffer is None:
+            # Redirected to a text-only stream (StringIO, IDE consoles)
+            stdout.write(_BANNER)
+            return
+        
+        encoding = stdout.encoding or 'utf-8'
+        if self._banner_bytes[0] != encoding:
+            # Match the text layer: platform newlines, unencodable emoji replaced
+            banner = _BANNER.replace('\n', os.linesep).encode(encoding, errors='replace')
+            self._banner_bytes = (encoding, banner)
+        
+        stdout.flush()  # keep ordering with text already written through the text layer
+        buffer.write(self._banner_bytes[1])
 
     def print_menu(self):
         """Print the main menu"""
-        print("📋 MAIN MENU")
-        print("-"*30)
-        print("1. Generate Profiles")
-        print("2. Export Data")
-        print("3. Generate HTML Visualizer")
-        print("4. Generate Wordlist")
-        print("5. View Statistics")
-        print("6. Clear All Data")
-        print("7. Exit")
-        print()
+        sys.stdout.write(_MAIN_MENU)
 
     def get_user_input(self, prompt: str, input_type: type = str, min_val: int = None, max_val: int = None):
         """Get and validate user input"""
         while True:
-            try:
-                value = input_type(input(prompt))
-                if min_val is not None and value < min_val:
-                    print(f"❌ Value must be at least {min_val}")
-                    continue
-                if max_val is not None and value > max_val:
-                    print(f"❌ Value must be no more than {max_val}")
+            raw = input(prompt)
+            # Plain digit answers (the common menu case) convert without the exception path
+            if input_type is int and raw.strip().isdecimal():
+                value = int(raw)
+            else:
+                try:
+                    value = input_type(raw)
+                except ValueError:
+                    print(f"❌ Please enter a valid {input_type.__name__}")
                     continue
-                return value
-            except ValueError:
-                print(f"❌ Please enter a valid {input_type.__name__}")
+            
+            if min_val is not None and value < min_val:
+                print(f"❌ Value must be at least {min_val}")
+                continue
+            if max_val is not None and value > max_val:
+                print(f"❌ Value must be no more than {max_val}")
+                continue
+            return value
 
     def generate_profiles_menu(self):
         """Handle profile generation"""
@@ -1091,6 +1471,7 @@ class MenuInterface:
                 
                 open_browser = input("🌍 Open in browser? (y/n): ").lower() == 'y'
                 if open_browser:
+                    import webbrowser
                     webbrowser.open(f'file://{os.path.abspath(filename)}')
                     print("🚀 Opening in browser...")
             
@@ -1099,6 +1480,24 @@ class MenuInterface:
         
         input("\nPress Enter to continue...")
 
+    def _preview_lines(self, filename: str, skip_comments: bool = True, limit: int = 3) -> tuple:
+        """Count the data lines of an export and keep the first few, streaming the file once"""
+        count = 0
+        preview = []
+        # Bytes lines are tested with a prefix slice; only the kept preview lines get decoded
+        with open(filename, 'rb', buffering=_EXPORT_BUFFER_SIZE) as f:
+            for line in f:
+                if skip_comments and line[:1] == b'#':
+                    continue
+                line = line.strip()
+                if not line:
+                    continue
+                count += 1
+                if len(preview) < limit:
+                    preview.append(line.decode('utf-8'))
+        
+        return count, preview
+
     def export_data_menu(self):
         """Handle data export"""
         if not self.generator.database['profiles']:
@@ -1158,13 +1557,11 @@ class MenuInterface:
                 print(f"✅ Hashes with usernames exported: {file}")
                 
                 # Show preview of hash file
-                with open(file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    hash_lines = [line.strip() for line in lines if not line.startswith('#') and line.strip()]
+                count, hash_lines = self._preview_lines(file, skip_comments=True)
                 
-                print(f"\n🔒 Generated {len(hash_lines)} password hashes (with usernames)")
+                print(f"\n🔒 Generated {count} password hashes (with usernames)")
                 print("🔍 Preview (first 3 entries):")
-                for i, line in enumerate(hash_lines[:3]):
+                for i, line in enumerate(hash_lines):
                     username, hash_val = line.split(':', 1)
                     print(f"  {i+1}. {username}:{hash_val[:20]}...{hash_val[-10:]}")
             
@@ -1175,13 +1572,11 @@ class MenuInterface:
                 print(f"✅ Hashcat format exported: {file}")
                 
                 # Show preview and hashcat usage info
-                with open(file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    hash_lines = [line.strip() for line in lines if line.strip()]
+                count, hash_lines = self._preview_lines(file, skip_comments=False)
                 
-                print(f"\n🔒 Generated {len(hash_lines)} clean SHA-512 hashes")
+                print(f"\n🔒 Generated {count} clean SHA-512 hashes")
                 print("🔍 Preview (first 3 entries):")
-                for i, hash_val in enumerate(hash_lines[:3]):
+                for i, hash_val in enumerate(hash_lines):
                     print(f"  {i+1}. {hash_val[:30]}...{hash_val[-20:]}")
                 
                 print(f"\n💡 Hashcat Usage:")
@@ -1196,13 +1591,11 @@ class MenuInterface:
                     print(f"✅ Salted Hashcat format exported: {file}")
                     
                     # Show preview and usage info
-                    with open(file, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        hash_lines = [line.strip() for line in lines if line.strip()]
+                    count, hash_lines = self._preview_lines(file, skip_comments=False)
                     
-                    print(f"\n🧂 Generated {len(hash_lines)} salted SHA-512 hashes")
+                    print(f"\n🧂 Generated {count} salted SHA-512 hashes")
                     print("🔍 Preview (first 3 entries):")
-                    for i, line in enumerate(hash_lines[:3]):
+                    for i, line in enumerate(hash_lines):
                         hash_part, salt_part = line.split(':', 1)
                         print(f"  {i+1}. {hash_part[:20]}...:{salt_part}")
                     
@@ -1221,13 +1614,11 @@ class MenuInterface:
                 print(f"✅ Hash reference exported: {file}")
                 
                 # Show preview
-                with open(file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    ref_lines = [line.strip() for line in lines if not line.startswith('#') and line.strip()]
+                count, ref_lines = self._preview_lines(file, skip_comments=True)
                 
-                print(f"\n🔑 Generated {len(ref_lines)} hash references")
+                print(f"\n🔑 Generated {count} hash references")
                 print("🔍 Preview (first 3 entries):")
-                for i, line in enumerate(ref_lines[:3]):
+                for i, line in enumerate(ref_lines):
                     parts = line.split(' | ')
                     if len(parts) >= 3:
                         username, hash_val, hint = parts[0], parts[1], parts[2]
@@ -1241,13 +1632,11 @@ class MenuInterface:
                     print(f"✅ Salt reference exported: {file}")
                     
                     # Show preview
-                    with open(file, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        ref_lines = [line.strip() for line in lines if not line.startswith('#') and line.strip()]
+                    count, ref_lines = self._preview_lines(file, skip_comments=True)
                     
-                    print(f"\n🧂 Generated {len(ref_lines)} salted hash references")
+                    print(f"\n🧂 Generated {count} salted hash references")
                     print("🔍 Preview (first 3 entries):")
-                    for i, line in enumerate(ref_lines[:3]):
+                    for i, line in enumerate(ref_lines):
                         parts = line.split(' | ')
                         if len(parts) >= 4:
                             username, hash_val, salt, hint = parts[0], parts[1], parts[2], parts[3]
@@ -1290,6 +1679,7 @@ class MenuInterface:
             
             open_browser = input("🌍 Open in browser? (y/n): ").lower() == 'y'
             if open_browser:
+                import webbrowser
                 webbrowser.open(f'file://{os.path.abspath(file)}')
                 print("🚀 Opening in browser...")
             
@@ -1315,7 +1705,9 @@ class MenuInterface:
             return
         
         custom_name = input("📝 Custom wordlist filename (optional): ").strip()
-        wordlist_filename = f"{custom_name}.txt" if custom_name else None
+        arrow = input("🏹 Save as Arrow IPC (.arrow, requires pyarrow)? (y/n): ").lower() == 'y'
+        extension = 'arrow' if arrow else 'txt'
+        wordlist_filename = f"{custom_name}.{extension}" if custom_name else None
         
         try:
             if choice == 1:
@@ -1325,20 +1717,16 @@ class MenuInterface:
                     input("Press Enter to continue...")
                     return
                 
-                filename = self.generator.generate_wordlist_from_current_data(wordlist_filename)
+                filename, count, preview = self.generator.generate_wordlist_info_from_current_data(wordlist_filename, arrow=arrow)
                 print(f"✅ Wordlist generated: {filename}")
                 
-                # Show preview of first few entries
-                with open(filename, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    data_lines = [line.strip() for line in lines if not line.startswith('#') and line.strip()]
-                    
-                print(f"\n📊 Generated {len(data_lines)} unique password candidates")
+                # Show preview of first few entries (returned by the generator, no need to re-read the file)
+                print(f"\n📊 Generated {count} unique password candidates")
                 print(f"🔍 Preview (first 10 entries):")
-                for i, entry in enumerate(data_lines[:10]):
-                    print(f"  {i+1}. {entry}")
-                if len(data_lines) > 10:
-                    print(f"  ... and {len(data_lines) - 10} more entries")
+                if preview:
+                    print("\n".join([f"  {i+1}. {entry}" for i, entry in enumerate(preview)]))
+                if count > 10:
+                    print(f"  ... and {count - 10} more entries")
             
             elif choice == 2:
                 # Generate from JSON file
@@ -1348,23 +1736,22 @@ class MenuInterface:
                     input("Press Enter to continue...")
                     return
                 
-                filename = self.generator.generate_wordlist_from_json(json_filename, wordlist_filename)
+                filename, count, preview = self.generator.generate_wordlist_info_from_json(
+                    json_filename, wordlist_filename, arrow=arrow)
                 print(f"✅ Wordlist generated: {filename}")
                 
                 # Show preview
-                with open(filename, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    data_lines = [line.strip() for line in lines if not line.startswith('#') and line.strip()]
-                    
-                print(f"\n📊 Generated {len(data_lines)} unique password candidates")
+                print(f"\n📊 Generated {count} unique password candidates")
                 print(f"🔍 Preview (first 10 entries):")
-                for i, entry in enumerate(data_lines[:10]):
-                    print(f"  {i+1}. {entry}")
+                if preview:
+                    print("\n".join([f"  {i+1}. {entry}" for i, entry in enumerate(preview)]))
         
         except FileNotFoundError as e:
             print(f"❌ File error: {e}")
         except ValueError as e:
             print(f"❌ Data error: {e}")
+        except ImportError as e:
+            print(f"❌ Missing dependency: {e}")
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
         
@@ -1374,49 +1761,56 @@ class MenuInterface:
         
         input("\nPress Enter to continue...")
 
+    def _profile_stats(self) -> tuple:
+        """Average age and most popular company from the generator's running aggregates"""
+        # The generator keeps running totals, so this is O(distinct companies), not O(profiles)
+        count, age_sum, company_counter = self.generator.profile_stats()
+        
+        # most_common(1) keeps the first company seen on ties
+        top_company, top_count = company_counter.most_common(1)[0]
+        return age_sum / count, top_company, top_count
+
     def view_statistics(self):
         """Display statistics about generated data"""
         self.clear_screen()
         self.print_banner()
-        print("📊 DATA STATISTICS")
-        print("-"*30)
         
         profiles = len(self.generator.database['profiles'])
         companies = len(self.generator.database['companies'])
         social_profiles = len(self.generator.database['social_profiles'])
         
-        print(f"👥 Total Profiles: {profiles}")
-        print(f"🏢 Total Companies: {companies}")
-        print(f"📱 Social Profiles: {social_profiles}")
+        # Collect the whole screen and write it once
+        out = [
+            "📊 DATA STATISTICS",
+            "-"*30,
+            f"👥 Total Profiles: {profiles}",
+            f"🏢 Total Companies: {companies}",
+            f"📱 Social Profiles: {social_profiles}",
+        ]
         
         if profiles > 0:
-            print(f"\n🔍 PROFILE BREAKDOWN")
-            print("-"*20)
-            
-            # Age distribution
-            ages = [p['age'] for p in self.generator.database['profiles']]
-            avg_age = sum(ages) / len(ages) if ages else 0
-            print(f"📈 Average Age: {avg_age:.1f} years")
-            
-            # Company distribution
-            company_counts = {}
-            for profile in self.generator.database['profiles']:
-                company = profile['company']
-                company_counts[company] = company_counts.get(company, 0) + 1
-            
-            print(f"🏆 Most Popular Company: {max(company_counts, key=company_counts.get)} ({max(company_counts.values())} employees)")
+            avg_age, top_company, top_count = self._profile_stats()
             
             # Show sample profile
             sample = self.generator.database['profiles'][0]
-            print(f"\n👤 SAMPLE PROFILE")
-            print("-"*20)
-            print(f"Name: {sample['full_name']}")
-            print(f"Email: {sample['email']}")
-            print(f"Company: {sample['company']}")
-            print(f"City: {sample['city']}")
+            out.extend((
+                "\n🔍 PROFILE BREAKDOWN",
+                "-"*20,
+                f"📈 Average Age: {avg_age:.1f} years",
+                f"🏆 Most Popular Company: {top_company} ({top_count} employees)",
+                "\n👤 SAMPLE PROFILE",
+                "-"*20,
+                f"Name: {sample['full_name']}",
+                f"Email: {sample['email']}",
+                f"Company: {sample['company']}",
+                f"City: {sample['city']}",
+            ))
         
         else:
-            print("\n❌ No data available. Generate profiles first!")
+            out.append("\n❌ No data available. Generate profiles first!")
+        
+        out.append("")
+        sys.stdout.write("\n".join(out))
         
         input("\nPress Enter to continue...")
 
@@ -1429,7 +1823,7 @@ class MenuInterface:
         
         confirm = input("⚠️  Are you sure you want to clear all data? (y/n): ").lower()
         if confirm == 'y':
-            self.generator.database = {'profiles': [], 'companies': [], 'social_profiles': [], 'relationships': []}
+            self.generator.clear()
             print("✅ All data cleared!")
         else:
             print("❌ Clear cancelled.")